@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from .client import TextbeltClient
 from .exceptions import TextbeltException
 from .models import (
@@ -12,6 +14,11 @@ from .models import (
     WebhookPayload,
 )
 
+# `AsyncTextbeltClient` is not listed in `__all__` so star imports
+# keep working when the optional `httpx` dependency is not installed.
+if TYPE_CHECKING:
+    from .async_client import AsyncTextbeltClient as AsyncTextbeltClient
+
 __all__ = [
     "CreditBalanceResponse",
     "OTPGenerateRequest",
@@ -25,3 +32,13 @@ __all__ = [
     "TextbeltException",
     "WebhookPayload",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # import async client lazily since it requires the optional `httpx` dependency.
+    if name == "AsyncTextbeltClient":
+        from .async_client import AsyncTextbeltClient
+
+        return AsyncTextbeltClient
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,60 @@
+import json
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from requests.exceptions import JSONDecodeError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# prefer `orjson` when installed, it parses bytes directly and is
+# considerably faster than the standard library `json` module.
+try:
+    import orjson
+
+    loads: Callable[[str | bytes], Any] = orjson.loads
+
+except ImportError:  # pragma: no cover
+    loads = json.loads
+
+
+def validate_response(
+    model: type[ModelT], content: bytes, decode_json: Callable[[], Any]
+) -> ModelT:
+    """
+    Parse and validate a Textbelt API response body in one pass.
+
+    Bodies pydantic cannot parse directly, such as ones in a non
+    utf-8 charset, fall back to `decode_json`, the http client's
+    own json decoder which honors the response charset. Malformed json is raised as a `requests` `JSONDecodeError`,
+    the same error `requests.Response.json()` raises, rather than as
+    a pydantic `ValidationError`.
+
+    Args:
+        model (type[ModelT]): response model to validate body against.
+        content (bytes): raw json response body.
+        decode_json (Callable[[], Any]): decodes the response body as json,
+            e.g. `requests.Response.json`.
+
+    Returns:
+        ModelT: validated response model.
+
+    Raises:
+        JSONDecodeError: raised if body is not valid json.
+        ValidationError: raised if body does not match the response model.
+    """
+
+    try:
+        return model.model_validate_json(content)
+
+    except ValidationError as e:
+        if e.errors(include_url=False)[0]["type"] != "json_invalid":
+            raise
+
+    try:
+        data = decode_json()
+    except JSONDecodeError:
+        raise
+    except json.JSONDecodeError as e:
+        raise JSONDecodeError(e.msg, e.doc, e.pos) from None
+
+    return model.model_validate(data)
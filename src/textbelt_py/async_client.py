@@ -0,0 +1,268 @@
+import json
+from types import TracebackType
+
+import httpx
+
+from ._json import validate_response
+from .client import _HTTP_POOL_MAXSIZE, BaseTextbeltClient
+from .decorators import wrap_exception
+from .exceptions import TextbeltException
+from .models import (
+    CreditBalanceResponse,
+    OTPGenerateRequest,
+    OTPGenerateResponse,
+    OTPVerificationRequest,
+    OTPVerificationResponse,
+    SMSRequest,
+    SMSResponse,
+    SMSStatusResponse,
+)
+
+
+class AsyncTextbeltClient(BaseTextbeltClient):
+    """
+    Async client class to interact with Textbelt API.
+
+    Requires a Textbelt API key as well as an `httpx.AsyncClient`
+    object for handling http requests.
+
+    If `session` is not provided, creates a new `session`
+    configured to make 3 retry attempts on connection errors,
+    pooling up to 50 keep-alive connections to the API.
+
+    All methods making http requests are coroutines sharing the
+    session's connection pool, so many requests can be in flight
+    at once on a single event loop, e.g. using `asyncio.gather`
+    to send a batch of messages concurrently. `verify_webhook`
+    does no I/O and remains a regular method.
+
+    Attributes:
+        api_key (str): required Textbelt API key.
+        session (httpx.AsyncClient): `httpx.AsyncClient` object used to make http requests.
+    """
+
+    def __init__(self, api_key: str, session: httpx.AsyncClient | None = None) -> None:
+        """
+        Initialize async Textbelt client instance.
+
+        Args:
+            api_key (str): required Textbelt API key.
+            session (httpx.AsyncClient | None): optional `AsyncClient`
+                used to make http requests.
+        """
+
+        super().__init__(api_key)
+        self.session = session if session else self._create_session()
+
+    async def __aenter__(self) -> "AsyncTextbeltClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying session and its pooled connections.
+        """
+
+        await self.session.aclose()
+
+    async def send_sms(self, sms_request: SMSRequest) -> SMSResponse:
+        """
+        Send an SMS to a phone number.
+
+        Takes an SMSRequest containing the phone, message,
+        and optionally, the sender, and makes a POST request
+        to Textbelt API to send a message.
+
+        If request contains a reply webhook url, the Textbelt API
+        will handle text replies from recipient by making
+        a callback to the given url.
+
+        Args:
+            sms_request (SMSRequest): request args used to create
+                payload to send an SMS from Textbelt.
+
+        Returns:
+            SMSResponse: contains the response data
+                returned from the API call made to Textbelt.
+
+        Raises:
+            TextbeltException: raised on any exceptions that occur during
+                execution.
+        """
+
+        try:
+            payload = sms_request.to_payload(self.api_key)
+
+            resp = await self.session.post(self._send_sms_url, data=payload)
+
+            resp.raise_for_status()
+
+            return validate_response(SMSResponse, resp.content, lambda: json.loads(resp.text))
+
+        except httpx.HTTPError as e:
+            raise TextbeltException(message="HTTPX error occurred", exception=e)
+
+        except Exception as e:
+            raise wrap_exception(e)
+
+    async def check_sms_delivery_status(self, text_id: str) -> SMSStatusResponse:
+        """
+        Check delivery status of an SMS.
+
+        Determines the delivery status of an SMS message
+        that was sent by Textbelt. Uses the given `text_id`
+        to find the status.
+
+        Args:
+            text_id (str): id of the SMS message to check status for.
+
+        Returns:
+            SMSStatusResponse: contains the text message's
+                current delivery status.
+
+        Raises:
+            TextbeltException: raised on any exceptions that occur during
+                execution.
+        """
+
+        try:
+            resp = await self.session.get(self._sms_status_url_prefix + text_id)
+
+            resp.raise_for_status()
+
+            return validate_response(SMSStatusResponse, resp.content, lambda: json.loads(resp.text))
+
+        except httpx.HTTPError as e:
+            raise TextbeltException(message="HTTPX error occurred", exception=e)
+
+        except Exception as e:
+            raise wrap_exception(e)
+
+    async def send_otp(self, otp_generate_request: OTPGenerateRequest) -> OTPGenerateResponse:
+        """
+        Send a one-time password to a phone number.
+
+        Takes an `OTPGenerateRequest` containing the `phone` and `user_id`,
+        to send an OTP via POST request to Textbelt API.
+
+        If the `lifetime`, `length`, and `message` are not provided, they default
+        to 180 seconds, 6 digits, and `"Your verification code is XXX"`,
+        respectively.
+
+        Args:
+            otp_generate_request (OTPGenerateRequest): request args used to create
+                payload to send an OTP from Textbelt.
+
+        Returns:
+            OTPGenerateResponse: contains the response data
+                returned from the API call made to Textbelt.
+
+        Raises:
+            TextbeltException: raised on any exceptions that occur during
+                execution.
+        """
+
+        try:
+            payload = otp_generate_request.to_payload(self.api_key)
+
+            resp = await self.session.post(self._otp_generate_url, data=payload)
+
+            resp.raise_for_status()
+
+            return validate_response(
+                OTPGenerateResponse, resp.content, lambda: json.loads(resp.text)
+            )
+
+        except httpx.HTTPError as e:
+            raise TextbeltException(message="HTTPX error occurred", exception=e)
+
+        except Exception as e:
+            raise wrap_exception(e)
+
+    async def verify_otp(
+        self, otp_verification_request: OTPVerificationRequest
+    ) -> OTPVerificationResponse:
+        """
+        Verify one-time password from the user is valid.
+
+        Takes an `OTPVerificationRequest` containing the `otp`
+        and `user_id` associated with the otp, and determines
+        whether the one-time password is valid for that given
+        user.
+
+        Args:
+            otp_verification_request (OTPVerificationRequest): request args used
+                to create payload to verify an OTP for a user from Textbelt.
+
+        Returns:
+            OTPVerificationResponse: contains the response data
+                returned from the API call made to Textbelt.
+
+        Raises:
+            TextbeltException: raised on any exceptions that occur during
+                execution.
+        """
+
+        try:
+            params = otp_verification_request.to_payload(self.api_key)
+
+            resp = await self.session.get(self._otp_verification_url, params=params)
+
+            resp.raise_for_status()
+
+            return validate_response(
+                OTPVerificationResponse, resp.content, lambda: json.loads(resp.text)
+            )
+
+        except httpx.HTTPError as e:
+            raise TextbeltException(message="HTTPX error occurred", exception=e)
+
+        except Exception as e:
+            raise wrap_exception(e)
+
+    async def check_credit_balance(self) -> CreditBalanceResponse:
+        """
+        Check the remaining credit balance on the account
+        associated with the API key.
+
+        Returns:
+            CreditBalanceResponse: contains the total amount
+                of credits/quota remaining.
+
+        Raises:
+            TextbeltException: raised on any exceptions that occur during
+                execution.
+        """
+
+        try:
+            resp = await self.session.get(self._check_credit_balance_url)
+
+            resp.raise_for_status()
+
+            return validate_response(
+                CreditBalanceResponse, resp.content, lambda: json.loads(resp.text)
+            )
+
+        except httpx.HTTPError as e:
+            raise TextbeltException(message="HTTPX error occurred", exception=e)
+
+        except Exception as e:
+            raise wrap_exception(e)
+
+    def _create_session(self) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(
+            retries=3,
+            limits=httpx.Limits(
+                max_connections=_HTTP_POOL_MAXSIZE,
+                max_keepalive_connections=_HTTP_POOL_MAXSIZE,
+            ),
+        )
+
+        return httpx.AsyncClient(transport=transport)
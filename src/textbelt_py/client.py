@@ -1,13 +1,16 @@
-import datetime
-import hashlib
+import binascii
 import hmac
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256 as _sha256
+from typing import Iterable
 
 from requests import Session
 from requests.adapters import HTTPAdapter, Retry
 
-from .decorators import exception_handler_decorator
+from ._json import loads, validate_response
+from .decorators import wrap_exception
+from .exceptions import TextbeltException
 from .models import (
     CreditBalanceResponse,
     OTPGenerateRequest,
@@ -20,8 +23,141 @@ from .models import (
     WebhookPayload,
 )
 
+# time limit for a valid webhook request is 15 minutes.
+_WEBHOOK_MAX_AGE_SECONDS = 15 * 60
 
-class TextbeltClient:
+# webhook signatures are hex encoded hmac-sha256 digests.
+_SIGNATURE_HEX_LENGTH = 2 * _sha256().digest_size
+
+# max connections kept alive to Textbelt API for concurrent callers.
+_HTTP_POOL_MAXSIZE = 50
+
+
+def _to_bytes(value: str | bytes) -> bytes:
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+class BaseTextbeltClient:
+    """
+    Base class for Textbelt API clients.
+
+    Holds the Textbelt API key and implements functionality
+    shared by the sync and async clients which does not make
+    http requests, such as webhook verification.
+
+    Attributes:
+        api_key (str): required Textbelt API key.
+    """
+
+    TEXTBELT_API_BASE_URL = "https://textbelt.com"
+
+    def __init__(self, api_key: str) -> None:
+        """
+        Initialize Textbelt client instance.
+
+        Args:
+            api_key (str): required Textbelt API key.
+        """
+
+        self._send_sms_url = f"{self.TEXTBELT_API_BASE_URL}/text"
+        self._sms_status_url_prefix = f"{self.TEXTBELT_API_BASE_URL}/status/"
+        self._otp_generate_url = f"{self.TEXTBELT_API_BASE_URL}/otp/generate"
+        self._otp_verification_url = f"{self.TEXTBELT_API_BASE_URL}/otp/verify"
+
+        self.api_key = api_key
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        # rebuild state derived from the api key so it is never stale.
+        # keying an hmac hashes the padded key, so it is done once per api key
+        # and copied for each webhook verified.
+        self._api_key = api_key
+        self._webhook_hmac = hmac.new(api_key.encode("utf-8"), digestmod=_sha256)
+        self._check_credit_balance_url = f"{self.TEXTBELT_API_BASE_URL}/quota/{api_key}"
+
+    def verify_webhook(
+        self,
+        request_timestamp: str | bytes,
+        request_signature: str | bytes,
+        request_payload: str | bytes,
+    ) -> tuple[bool, WebhookPayload | None]:
+        """
+        Verify incoming Textbelt webhook.
+
+        Confirms the reply webhook request made by Textbelt
+        is not forged or expired, and is a valid request.
+        Verification is done by first, checking the request
+        timestamp is valid and within the 15 minute time limit. Then compares
+        the request signature with the calculated signature for a match.
+        Malformed timestamps and signatures are treated as invalid.
+
+        Values can be given as `str` or as raw `bytes`. Passing the
+        request body bytes as received avoids decoding it only
+        for it to be re-encoded to compute the signature.
+
+        Args:
+            request_timestamp (str | bytes): UNIX timestamp
+                from webhook request headers (`X-textbelt-timestamp`).
+            request_signature (str | bytes): hex encoded hmac signature
+                from webhook request headers (`X-textbelt-signature`)
+            request_payload (str | bytes): raw json payload
+                from webhook request body.
+
+        Returns:
+            Tuple[bool, WebhookPayload]: denotes the verification status
+                of webhook. If webhook not valid, returns `False` and `None`.
+                Otherwise returns `True` and a `WebhookPayload` containing the parsed json
+                payload data.
+
+        Raises:
+            TextbeltException: raised on any exceptions that occur during
+                execution.
+        """
+
+        try:
+            try:
+                timestamp = int(request_timestamp)
+            except ValueError:
+                return False, None
+
+            current_time = int(time.time())
+
+            if current_time - timestamp > _WEBHOOK_MAX_AGE_SECONDS:
+                return False, None
+
+            # reject signatures that cannot be a hex sha256 digest before hashing.
+            if len(request_signature) != _SIGNATURE_HEX_LENGTH:
+                return False, None
+
+            try:
+                request_signature_bytes = binascii.unhexlify(request_signature)
+            except ValueError:
+                return False, None
+
+            # feed timestamp and payload separately to avoid building a
+            # concatenated copy of the (potentially large) payload.
+            mac = self._webhook_hmac.copy()
+            mac.update(_to_bytes(request_timestamp))
+            mac.update(_to_bytes(request_payload))
+            signature = mac.digest()
+
+            signature_is_valid = hmac.compare_digest(request_signature_bytes, signature)
+            if not signature_is_valid:
+                return False, None
+
+            payload_json = loads(request_payload)
+
+            return True, WebhookPayload.model_validate(payload_json)
+
+        except Exception as e:
+            raise wrap_exception(e)
+
+
+class TextbeltClient(BaseTextbeltClient):
     """
     Client class to interact with Textbelt API.
 
@@ -29,15 +165,14 @@ class TextbeltClient:
     object for handling http requests.
 
     If `session` is not provided, creates a new `session`
-    configured to make 3 retry attempts with backoff factor of 1.
+    configured to make 3 retry attempts with backoff factor of 1,
+    pooling up to 50 keep-alive connections to the API.
 
     Attributes:
         api_key (str): required Textbelt API key.
         session (Session): `requests.Session` object used to make http requests.
     """
 
-    TEXTBELT_API_BASE_URL = "https://textbelt.com"
-
     def __init__(self, api_key: str, session: Session | None = None) -> None:
         """
         Initialize Textbelt client instance.
@@ -47,10 +182,9 @@ class TextbeltClient:
             session (Session | None): optional `Session` used to make http requests.
         """
 
-        self.api_key = api_key
+        super().__init__(api_key)
         self.session = session if session else self._create_session()
 
-    @exception_handler_decorator
     def send_sms(self, sms_request: SMSRequest) -> SMSResponse:
         """
         Send an SMS to a phone number.
@@ -76,73 +210,67 @@ class TextbeltClient:
                 execution.
         """
 
-        send_sms_url = f"{self.TEXTBELT_API_BASE_URL}/text"
+        try:
+            payload = sms_request.to_payload(self.api_key)
 
-        payload = sms_request.model_dump(exclude_unset=True, by_alias=True)
-        payload["key"] = self.api_key
+            resp = self.session.post(self._send_sms_url, payload)
 
-        resp = self.session.post(send_sms_url, payload)
+            resp.raise_for_status()
 
-        resp.raise_for_status()
+            return validate_response(SMSResponse, resp.content, resp.json)
 
-        json_resp = resp.json()
+        except Exception as e:
+            raise wrap_exception(e)
 
-        return SMSResponse.model_validate(json_resp)
-
-    @exception_handler_decorator
-    def verify_webhook(
-        self, request_timestamp: str, request_signature: str, request_payload: str
-    ) -> tuple[bool, WebhookPayload | None]:
+    def send_sms_batch(
+        self, sms_requests: Iterable[SMSRequest], max_workers: int = 10
+    ) -> list[SMSResponse | TextbeltException]:
         """
-        Verify incoming Textbelt webhook.
+        Send multiple SMS messages concurrently.
 
-        Confirms the reply webhook request made by Textbelt
-        is not forged or expired, and is a valid request.
-        Verification is done by first, checking the request
-        timestamp is within the 15 minute time limit. Then compares
-        the request signature with the calculated signature for a match.
+        Sends each SMSRequest with `send_sms` from a pool of
+        `max_workers` threads sharing the client's session, so
+        requests overlap on pooled connections instead of being
+        sent one after another. The default session pools up to
+        50 connections, `max_workers` should not exceed the
+        session's pool size.
+
+        Every request is sent, even if others fail. Failed requests
+        are returned as the `TextbeltException` raised by `send_sms`
+        in place of their response, so callers can tell exactly
+        which messages were sent and only retry the ones that failed.
 
         Args:
-            request_timestamp (str): UNIX timestamp as string
-                from webhook request headers (`X-textbelt-timestamp`).
-            request_signature (str): hmac signature as string
-                from webhook request headers (`X-textbelt-signature`)
-            request_payload (str): raw json payload as string
-                from webhook request body.
+            sms_requests (Iterable[SMSRequest]): request args used to create
+                payloads to send SMS messages from Textbelt.
+            max_workers (int): max number of messages sent at once.
+                Defaults to 10.
 
         Returns:
-            Tuple[bool, WebhookPayload]: denotes the verification status
-                of webhook. If webhook not valid, returns `False` and `None`.
-                Otherwise returns `True` and a `WebhookPayload` containing the parsed json
-                payload data.
+            list[SMSResponse | TextbeltException]: contains the response data
+                returned from the API call made to Textbelt for each request,
+                or the exception raised for requests that failed, in the same
+                order as `sms_requests`.
 
         Raises:
-            TextbeltException: raised on any exceptions that occur during
-                execution.
+            TextbeltException: raised if `max_workers` is less than 1.
         """
 
-        timestamp = int(request_timestamp)
-        current_time = int(time.time())
-
-        # time limit for a valid webhook request is 15 minutes.
-        if current_time - timestamp > datetime.timedelta(minutes=15).seconds:
-            return False, None
+        if max_workers < 1:
+            raise TextbeltException(message="max_workers must be greater than 0")
 
-        signature = hmac.new(
-            self.api_key.encode("utf-8"),
-            (request_timestamp + request_payload).encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.send_sms, req) for req in sms_requests]
 
-        signature_is_valid = hmac.compare_digest(request_signature, signature)
-        if not signature_is_valid:
-            return False, None
+        results: list[SMSResponse | TextbeltException] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except TextbeltException as e:
+                results.append(e)
 
-        payload_json = json.loads(request_payload)
+        return results
 
-        return True, WebhookPayload.model_validate(payload_json)
-
-    @exception_handler_decorator
     def check_sms_delivery_status(self, text_id: str) -> SMSStatusResponse:
         """
         Check delivery status of an SMS.
@@ -163,17 +291,16 @@ class TextbeltClient:
                 execution.
         """
 
-        sms_status_url = f"{self.TEXTBELT_API_BASE_URL}/status/{text_id}"
-
-        resp = self.session.get(sms_status_url)
+        try:
+            resp = self.session.get(self._sms_status_url_prefix + text_id)
 
-        resp.raise_for_status()
+            resp.raise_for_status()
 
-        json_resp = resp.json()
+            return validate_response(SMSStatusResponse, resp.content, resp.json)
 
-        return SMSStatusResponse.model_validate(json_resp)
+        except Exception as e:
+            raise wrap_exception(e)
 
-    @exception_handler_decorator
     def send_otp(self, otp_generate_request: OTPGenerateRequest) -> OTPGenerateResponse:
         """
         Send a one-time password to a phone number.
@@ -198,20 +325,18 @@ class TextbeltClient:
                 execution.
         """
 
-        otp_generate_url = f"{self.TEXTBELT_API_BASE_URL}/otp/generate"
-
-        payload = otp_generate_request.model_dump(exclude_unset=True, by_alias=True)
-        payload["key"] = self.api_key
+        try:
+            payload = otp_generate_request.to_payload(self.api_key)
 
-        resp = self.session.post(otp_generate_url, payload)
+            resp = self.session.post(self._otp_generate_url, payload)
 
-        resp.raise_for_status()
+            resp.raise_for_status()
 
-        json_resp = resp.json()
+            return validate_response(OTPGenerateResponse, resp.content, resp.json)
 
-        return OTPGenerateResponse.model_validate(json_resp)
+        except Exception as e:
+            raise wrap_exception(e)
 
-    @exception_handler_decorator
     def verify_otp(
         self, otp_verification_request: OTPVerificationRequest
     ) -> OTPVerificationResponse:
@@ -236,20 +361,18 @@ class TextbeltClient:
                 execution.
         """
 
-        otp_verification_url = f"{self.TEXTBELT_API_BASE_URL}/otp/verify"
+        try:
+            params = otp_verification_request.to_payload(self.api_key)
 
-        params = otp_verification_request.model_dump(by_alias=True)
-        params["key"] = self.api_key
+            resp = self.session.get(self._otp_verification_url, params=params)
 
-        resp = self.session.get(otp_verification_url, params=params)
+            resp.raise_for_status()
 
-        resp.raise_for_status()
+            return validate_response(OTPVerificationResponse, resp.content, resp.json)
 
-        json_resp = resp.json()
+        except Exception as e:
+            raise wrap_exception(e)
 
-        return OTPVerificationResponse.model_validate(json_resp)
-
-    @exception_handler_decorator
     def check_credit_balance(self) -> CreditBalanceResponse:
         """
         Check the remaining credit balance on the account
@@ -264,19 +387,25 @@ class TextbeltClient:
                 execution.
         """
 
-        check_credit_balance_url = f"{self.TEXTBELT_API_BASE_URL}/quota/{self.api_key}"
-
-        resp = self.session.get(check_credit_balance_url)
+        try:
+            resp = self.session.get(self._check_credit_balance_url)
 
-        resp.raise_for_status()
+            resp.raise_for_status()
 
-        json_resp = resp.json()
+            return validate_response(CreditBalanceResponse, resp.content, resp.json)
 
-        return CreditBalanceResponse.model_validate(json_resp)
+        except Exception as e:
+            raise wrap_exception(e)
 
     def _create_session(self) -> Session:
         retry = Retry(total=3, backoff_factor=1)
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        # all calls go to a single host, so one pool sized for
+        # concurrent callers is enough to reuse connections.
+        retry_adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=1,
+            pool_maxsize=_HTTP_POOL_MAXSIZE,
+        )
         session = Session()
         session.mount("http://", retry_adapter)
         session.mount("https://", retry_adapter)
@@ -9,21 +9,27 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+def wrap_exception(e: Exception) -> TextbeltException:
+    # textbelt exceptions are propagated as is, since callers handle every
+    # exception in a single `except Exception` they would otherwise be re-wrapped.
+    if isinstance(e, TextbeltException):
+        return e
+
+    if isinstance(e, ValidationError):
+        return TextbeltException(message="Pydantic error occurred", exception=e)
+
+    if isinstance(e, (HTTPError, JSONDecodeError)):
+        return TextbeltException(message="Requests error occurred", exception=e)
+
+    return TextbeltException(message="Unexpected error occurred", exception=e)
+
+
 def exception_handler_decorator(func: Callable[P, T]) -> Callable[P, T]:
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         try:
             return func(*args, **kwargs)
 
-        except TextbeltException as e:
-            raise e
-
-        except ValidationError as e:
-            raise TextbeltException(message="Pydantic error occurred", exception=e)
-
-        except (HTTPError, JSONDecodeError) as e:
-            raise TextbeltException(message="Requests error occurred", exception=e)
-
         except Exception as e:
-            raise TextbeltException(message="Unexpected error occurred", exception=e)
+            raise wrap_exception(e)
 
     return wrapper
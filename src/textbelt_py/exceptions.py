@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class TextbeltException(Exception):
     """
     Base exception class used to denote any errors
@@ -19,6 +22,8 @@ class TextbeltException(Exception):
             that is being wrapped.
     """
 
+    __slots__ = ("_message", "_formatted", "exception", "ex_type")
+
     def __init__(
         self,
         message: str,
@@ -32,16 +37,44 @@ class TextbeltException(Exception):
 
         If exception is provided, the type and message from the
         wrapped exception are added to textbelt exception message.
+        The full message is only built once it is first accessed.
 
         Args:
             message (str): error message containing information of issue.
             exception (Exception | None): optional exception being wrapped.
         """
 
-        if exception:
-            message = f"{message} (Type = {type(exception)} | Message = {str(exception)})"
-
         super().__init__(message)
-        self.message = message
+        self._message = message
+        self._formatted: str | None = None
         self.exception = exception
         self.ex_type = type(exception) if exception else None
+
+    @property
+    def message(self) -> str:
+        if self._formatted is None:
+            if self.exception:
+                self._formatted = f"{self._message} (Type = {type(self.exception)} | Message = {str(self.exception)})"
+            else:
+                self._formatted = self._message
+
+        return self._formatted
+
+    @message.setter
+    def message(self, message: str) -> None:
+        # assigned messages are used as is, like the plain attribute they replace.
+        self._message = message
+        self._formatted = message
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # slot values are not part of the default exception pickle state,
+        # rebuild from constructor args so pickle and copy keep them, along
+        # with the instance `__dict__` holding notes and any other attributes.
+        return (
+            type(self),
+            (self._message, self.exception),
+            {**self.__dict__, "_formatted": self._formatted},
+        )
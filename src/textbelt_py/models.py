@@ -1,9 +1,52 @@
 from enum import Enum
+from typing import Any, ClassVar, Literal
 
 from pydantic import BaseModel, Field
 
 
-class SMSRequest(BaseModel):
+class _RequestModel(BaseModel):
+    """
+    Base model for request data sent to Textbelt API.
+
+    Builds the field name to payload key mapping once per class
+    so requests can be serialized without going through `model_dump`.
+    """
+
+    _payload_keys: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._payload_keys = tuple(
+            (name, field.serialization_alias or name) for name, field in cls.model_fields.items()
+        )
+
+    def to_payload(self, api_key: str) -> dict[str, Any]:
+        """
+        Serialize request into the payload sent to Textbelt API.
+
+        Fields are keyed by their serialization alias and fields
+        without a value are omitted.
+
+        Args:
+            api_key (str): Textbelt API key to include in payload.
+
+        Returns:
+            dict[str, Any]: request payload containing the API key.
+        """
+
+        payload: dict[str, Any] = {}
+        for name, key in self._payload_keys:
+            value = getattr(self, name)
+            if value is not None:
+                payload[key] = value
+
+        payload["key"] = api_key
+
+        return payload
+
+
+class SMSRequest(_RequestModel):
     """
     SMS request data used to send a text message.
 
@@ -79,10 +122,18 @@ class WebhookPayload(BaseModel):
     data: str | None = Field(default=None, max_length=100)
 
 
+# all possible statuses of a text message.
+SMSStatus = Literal["DELIVERED", "SENT", "SENDING", "FAILED", "UNKNOWN"]
+
+
 class Status(str, Enum):
     """
     Enum representing all possible statuses
     of a text message.
+
+    Deprecated: `SMSStatusResponse.status` is now a plain
+    `SMSStatus` string. Kept for backward compatibility,
+    members still compare equal to the status strings.
     """
 
     DELIVERED = "DELIVERED"  # Carrier has confirmed sending
@@ -102,13 +153,13 @@ class SMSStatusResponse(BaseModel):
     the status of an SMS.
 
     Attributes:
-        status (Status): the current status of the SMS message.
+        status (SMSStatus): the current status of the SMS message.
     """
 
-    status: Status
+    status: SMSStatus
 
 
-class OTPGenerateRequest(BaseModel):
+class OTPGenerateRequest(_RequestModel):
     """
     Generate one-time password request data.
 
@@ -161,7 +212,7 @@ class OTPGenerateResponse(BaseModel):
     otp: str
 
 
-class OTPVerificationRequest(BaseModel):
+class OTPVerificationRequest(_RequestModel):
     """
     Verification of one-time password request data.
 
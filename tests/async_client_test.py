@@ -0,0 +1,323 @@
+import asyncio
+import datetime
+import hmac
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Coroutine
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from requests.exceptions import JSONDecodeError
+
+import textbelt_py
+from textbelt_py import (
+    AsyncTextbeltClient,
+    CreditBalanceResponse,
+    OTPGenerateRequest,
+    OTPGenerateResponse,
+    OTPVerificationRequest,
+    OTPVerificationResponse,
+    SMSRequest,
+    SMSResponse,
+    SMSStatusResponse,
+    TextbeltException,
+)
+
+from .constants import TEST_API_KEY, TEST_API_KEY_BYTES, WEBHOOK_PAYLOAD, WEBHOOK_PAYLOAD_BYTES
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def create_client(handler: Handler) -> AsyncTextbeltClient:
+    return AsyncTextbeltClient(
+        TEST_API_KEY,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_lazy_import__raises_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        textbelt_py.NotAClient
+
+
+def test_star_import__without_httpx() -> None:
+    # block `httpx` from being imported to simulate the `async` extra not being installed.
+    code = (
+        "import sys; sys.modules['httpx'] = None; from textbelt_py import *; print(TextbeltClient)"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "TextbeltClient" in result.stdout
+    assert "AsyncTextbeltClient" not in textbelt_py.__all__
+
+
+def test_create_session() -> None:
+    async def create_and_close() -> httpx.AsyncClient:
+        async with AsyncTextbeltClient(TEST_API_KEY) as textbelt_client:
+            session = textbelt_client.session
+
+        return session
+
+    session = asyncio.run(create_and_close())
+
+    assert isinstance(session, httpx.AsyncClient)
+    assert session.is_closed is True
+
+
+def test_send_sms() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.url == "https://textbelt.com/text"
+        assert parse_qs(request.content.decode()) == {
+            "phone": ["2123124123"],
+            "message": ["Hello World"],
+            "sender": ["test_sender@textbelt.com"],
+            "key": ["test_api_key"],
+        }
+
+        return httpx.Response(200, json={"success": True, "quotaRemaining": 40, "textId": "12345"})
+
+    sms_req = SMSRequest(
+        phone="2123124123",
+        message="Hello World",
+        sender="test_sender@textbelt.com",
+    )
+
+    sms_res = asyncio.run(create_client(handler).send_sms(sms_req))
+
+    assert sms_res is not None and isinstance(sms_res, SMSResponse), (
+        "Expected an SMS response to be returned"
+    )
+    assert sms_res.success is True
+    assert sms_res.text_id == "12345"
+    assert sms_res.quota_remaining == 40
+    assert sms_res.error is None
+
+
+def test_send_sms__raises_textbelt_exception() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    sms_req = SMSRequest(phone="2123124123", message="Hello World")
+
+    with pytest.raises(TextbeltException) as ex_info:
+        asyncio.run(create_client(handler).send_sms(sms_req))
+
+    assert "HTTPX error occurred (Type = <class 'httpx.HTTPStatusError'>" in ex_info.value.message
+    assert isinstance(ex_info.value.exception, httpx.HTTPStatusError)
+    assert ex_info.value.ex_type is httpx.HTTPStatusError
+
+
+def test_verify_webhook() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("Expected webhook verification to not make any http requests")
+
+    timestamp = int(time.time()) - datetime.timedelta(minutes=5).seconds
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        str(timestamp).encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
+
+    is_valid, webhook_payload = create_client(handler).verify_webhook(
+        str(timestamp),
+        signature,
+        WEBHOOK_PAYLOAD,
+    )
+
+    assert is_valid is True
+    assert webhook_payload is not None
+    assert webhook_payload.text_id == "123456"
+
+
+def test_check_sms_delivery_status() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        assert request.url == "https://textbelt.com/status/589290745829430284"
+
+        return httpx.Response(200, json={"status": "DELIVERED"})
+
+    sms_status_response = asyncio.run(
+        create_client(handler).check_sms_delivery_status("589290745829430284")
+    )
+
+    assert sms_status_response is not None and isinstance(sms_status_response, SMSStatusResponse), (
+        "Expected to get an SMS status response to be returned"
+    )
+    assert sms_status_response.status == "DELIVERED"
+
+
+def test_check_sms_delivery_status__raises_textbelt_exception() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": "INVALID_STATUS"})
+
+    with pytest.raises(TextbeltException) as ex_info:
+        asyncio.run(create_client(handler).check_sms_delivery_status("589290745829430284"))
+
+    assert (
+        "Pydantic error occurred (Type = <class 'pydantic_core._pydantic_core.ValidationError'> | Message = 1 validation error for SMSStatusResponse"
+        in ex_info.value.message
+    )
+    assert ex_info.value.ex_type is ValidationError
+
+
+def test_send_otp() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.url == "https://textbelt.com/otp/generate"
+        assert parse_qs(request.content.decode()) == {
+            "phone": ["+15557727420"],
+            "userid": ["test_userid_12345"],
+            "key": ["test_api_key"],
+        }
+
+        return httpx.Response(
+            200,
+            json={"success": True, "textId": "1234", "quotaRemaining": 70, "otp": "672383"},
+        )
+
+    otp_generate_req = OTPGenerateRequest(phone="+15557727420", user_id="test_userid_12345")
+
+    otp_generate_res = asyncio.run(create_client(handler).send_otp(otp_generate_req))
+
+    assert otp_generate_res is not None and isinstance(otp_generate_res, OTPGenerateResponse), (
+        "Expected an OTP generate response to be returned"
+    )
+    assert otp_generate_res.success is True
+    assert otp_generate_res.text_id == "1234"
+    assert otp_generate_res.quota_remaining == 70
+    assert otp_generate_res.otp == "672383"
+
+
+def test_verify_otp() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        assert request.url.path == "/otp/verify"
+        assert dict(request.url.params) == {
+            "otp": "321654",
+            "userid": "test_userid_12345",
+            "key": "test_api_key",
+        }
+
+        return httpx.Response(200, json={"success": True, "isValidOtp": True})
+
+    otp_verification_req = OTPVerificationRequest(otp="321654", user_id="test_userid_12345")
+
+    otp_verification_res = asyncio.run(create_client(handler).verify_otp(otp_verification_req))
+
+    assert otp_verification_res is not None and isinstance(
+        otp_verification_res,
+        OTPVerificationResponse,
+    ), "Expected an OTP verification response to be returned"
+    assert otp_verification_res.success is True
+    assert otp_verification_res.is_valid_otp is True
+
+
+def test_check_credit_balance() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        assert request.url == f"https://textbelt.com/quota/{TEST_API_KEY}"
+
+        return httpx.Response(200, json={"success": True, "quotaRemaining": 100})
+
+    credit_balance_response = asyncio.run(create_client(handler).check_credit_balance())
+
+    assert credit_balance_response is not None and isinstance(
+        credit_balance_response, CreditBalanceResponse
+    ), "Expected a credit balance response to be returned"
+    assert credit_balance_response.success is True
+    assert credit_balance_response.quota_remaining == 100
+
+
+def test_check_credit_balance__latin1_body() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content='{"success": true, "quotaRemaining": 100, "note": "café"}'.encode("latin-1"),
+            headers={"Content-Type": "application/json; charset=latin-1"},
+        )
+
+    credit_balance_response = asyncio.run(create_client(handler).check_credit_balance())
+
+    assert credit_balance_response.success is True
+    assert credit_balance_response.quota_remaining == 100
+
+
+def test_check_credit_balance__invalid_json_raises_textbelt_exception() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"not json")
+
+    with pytest.raises(TextbeltException) as ex_info:
+        asyncio.run(create_client(handler).check_credit_balance())
+
+    assert (
+        ex_info.value.message
+        == "Requests error occurred (Type = <class 'requests.exceptions.JSONDecodeError'> | Message = Expecting value: line 1 column 1 (char 0))"
+    )
+    assert ex_info.value.ex_type is JSONDecodeError
+
+
+def test_check_credit_balance__raises_textbelt_exception() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise Exception("Test Exception")
+
+    with pytest.raises(TextbeltException) as ex_info:
+        asyncio.run(create_client(handler).check_credit_balance())
+
+    assert (
+        "Unexpected error occurred (Type = <class 'Exception'> | Message = Test Exception)"
+        in ex_info.value.message
+    )
+    assert ex_info.value.ex_type is Exception
+
+
+client_method_test_cases: list[Callable[[AsyncTextbeltClient], Coroutine[Any, Any, object]]] = [
+    lambda client: client.send_sms(SMSRequest(phone="2123124123", message="Hello World")),
+    lambda client: client.check_sms_delivery_status("589290745829430284"),
+    lambda client: client.send_otp(
+        OTPGenerateRequest(phone="+15557727420", user_id="test_userid_12345")
+    ),
+    lambda client: client.verify_otp(
+        OTPVerificationRequest(otp="321654", user_id="test_userid_12345")
+    ),
+    lambda client: client.check_credit_balance(),
+]
+
+
+@pytest.mark.parametrize("client_method", client_method_test_cases)
+def test_client_methods__httpx_error_raises_textbelt_exception(
+    client_method: Callable[[AsyncTextbeltClient], Coroutine[Any, Any, object]],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Test Connect Error")
+
+    with pytest.raises(TextbeltException) as ex_info:
+        asyncio.run(client_method(create_client(handler)))
+
+    assert (
+        ex_info.value.message
+        == "HTTPX error occurred (Type = <class 'httpx.ConnectError'> | Message = Test Connect Error)"
+    )
+    assert ex_info.value.ex_type is httpx.ConnectError
+
+
+@pytest.mark.parametrize("client_method", client_method_test_cases)
+def test_client_methods__unexpected_error_raises_textbelt_exception(
+    client_method: Callable[[AsyncTextbeltClient], Coroutine[Any, Any, object]],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise Exception("Test Exception")
+
+    with pytest.raises(TextbeltException) as ex_info:
+        asyncio.run(client_method(create_client(handler)))
+
+    assert (
+        ex_info.value.message
+        == "Unexpected error occurred (Type = <class 'Exception'> | Message = Test Exception)"
+    )
+    assert ex_info.value.ex_type is Exception
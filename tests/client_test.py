@@ -1,13 +1,16 @@
 import datetime
-import hashlib
 import hmac
 import json
 import time
+from typing import get_args
+from urllib.parse import parse_qs, parse_qsl
 
 import pytest
 import responses
 from pydantic import ValidationError
-from requests.exceptions import HTTPError
+from requests import PreparedRequest
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, JSONDecodeError
 
 from textbelt_py import (
     CreditBalanceResponse,
@@ -21,43 +24,96 @@ from textbelt_py import (
     TextbeltClient,
     TextbeltException,
 )
-from textbelt_py.models import Status
+from textbelt_py.models import SMSStatus, Status
 
-TEST_API_KEY = "test_api_key"
+from .constants import TEST_API_KEY, TEST_API_KEY_BYTES, WEBHOOK_PAYLOAD, WEBHOOK_PAYLOAD_BYTES
 
+TEST_SMS_REQUEST = SMSRequest(
+    phone="2123124123",
+    message="Hello World",
+    sender="test_sender@textbelt.com",
+)
+TEST_SMS_WEBHOOK_REQUEST = SMSRequest(
+    phone="2123124123",
+    message="Hello World",
+    reply_webhook_url="https://my.site/api/handleSmsReply",
+    webhook_data="custom webhook data",
+    sender="test_sender@textbelt.com",
+)
+TEST_OTP_GENERATE_REQUEST = OTPGenerateRequest(phone="+15557727420", user_id="test_userid_12345")
+TEST_OTP_VERIFICATION_REQUEST = OTPVerificationRequest(otp="321654", user_id="test_userid_12345")
+
+SMS_RESPONSE_BODY = b'{"success": "true", "quotaRemaining": 40, "textId": "12345"}'
+OTP_GENERATE_RESPONSE_BODY = (
+    b'{"success": "true", "textId": "1234", "quotaRemaining": 70, "otp": "672383"}'
+)
+INVALID_OTP_GENERATE_RESPONSE_BODY = b'{"success": "invalid"}'
+
+ResponseCallbackResult = tuple[int, dict[str, str], bytes]
+
+
+def sms_response_callback(request: PreparedRequest) -> ResponseCallbackResult:
+    return 200, {}, SMS_RESPONSE_BODY
+
+
+def otp_generate_response_callback(request: PreparedRequest) -> ResponseCallbackResult:
+    return 200, {}, OTP_GENERATE_RESPONSE_BODY
+
+
+def invalid_otp_generate_response_callback(request: PreparedRequest) -> ResponseCallbackResult:
+    return 200, {}, INVALID_OTP_GENERATE_RESPONSE_BODY
+
+
+def last_request_params() -> dict[str, str]:
+    return dict(parse_qsl(str(responses.calls[-1].request.body)))
 
-@pytest.fixture
-def textbelt_client() -> TextbeltClient:
-    return TextbeltClient(TEST_API_KEY, None)
+
+def test_create_session(textbelt_client: TextbeltClient) -> None:
+    adapter = textbelt_client.session.get_adapter("https://textbelt.com")
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.max_retries.total == 3
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 50
 
 
 @responses.activate
-def test_send_sms(textbelt_client: TextbeltClient) -> None:
-    exp_resp = responses.Response(
-        method="POST",
-        url="https://textbelt.com/text",
-        json={"success": "true", "quotaRemaining": 40, "textId": "12345"},
-        match=[
-            responses.matchers.urlencoded_params_matcher(
-                {
-                    "phone": "2123124123",
-                    "message": "Hello World",
-                    "sender": "test_sender@textbelt.com",
-                    "key": "test_api_key",
-                },
-            ),
-        ],
+def test_set_api_key() -> None:
+    textbelt_client = TextbeltClient(TEST_API_KEY)
+    textbelt_client.api_key = "new_test_api_key"
+    responses.get(
+        "https://textbelt.com/quota/new_test_api_key",
+        json={"success": True, "quotaRemaining": 100},
     )
-    responses.add(exp_resp)
 
-    sms_req = SMSRequest(
-        phone="2123124123",
-        message="Hello World",
-        sender="test_sender@textbelt.com",
+    credit_balance_response = textbelt_client.check_credit_balance()
+
+    timestamp = str(int(time.time()))
+    signature = hmac.digest(
+        b"new_test_api_key",
+        timestamp.encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
+    is_valid, _ = textbelt_client.verify_webhook(timestamp, signature, WEBHOOK_PAYLOAD)
+
+    assert textbelt_client.api_key == "new_test_api_key"
+    assert credit_balance_response.quota_remaining == 100
+    assert is_valid is True
+
+
+@responses.activate
+def test_send_sms(textbelt_client: TextbeltClient) -> None:
+    responses.add_callback(
+        responses.POST, "https://textbelt.com/text", callback=sms_response_callback
     )
 
-    sms_res = textbelt_client.send_sms(sms_req)
+    sms_res = textbelt_client.send_sms(TEST_SMS_REQUEST)
 
+    assert last_request_params() == {
+        "phone": "2123124123",
+        "message": "Hello World",
+        "sender": "test_sender@textbelt.com",
+        "key": "test_api_key",
+    }
     assert sms_res is not None and isinstance(sms_res, SMSResponse), (
         "Expected an SMS response to be returned"
     )
@@ -72,14 +128,9 @@ def test_send_sms__raises_textbelt_exception(
     textbelt_client: TextbeltClient,
 ) -> None:
     responses.post("https://textbelt.com/text", body=HTTPError("Test HTTP Error"))
-    sms_req = SMSRequest(
-        phone="2123124123",
-        message="Hello World",
-        sender="test_sender@textbelt.com",
-    )
 
     with pytest.raises(TextbeltException) as ex_info:
-        textbelt_client.send_sms(sms_req)
+        textbelt_client.send_sms(TEST_SMS_REQUEST)
 
     assert (
         ex_info.value.message
@@ -91,35 +142,20 @@ def test_send_sms__raises_textbelt_exception(
 
 @responses.activate
 def test_send_sms_with_reply_webhook(textbelt_client: TextbeltClient) -> None:
-    exp_resp = responses.Response(
-        method="POST",
-        url="https://textbelt.com/text",
-        json={"success": "true", "quotaRemaining": 40, "textId": "12345"},
-        match=[
-            responses.matchers.urlencoded_params_matcher(
-                {
-                    "phone": "2123124123",
-                    "message": "Hello World",
-                    "sender": "test_sender@textbelt.com",
-                    "replyWebhookUrl": "https://my.site/api/handleSmsReply",
-                    "webhookData": "custom webhook data",
-                    "key": "test_api_key",
-                },
-            ),
-        ],
-    )
-    responses.add(exp_resp)
-
-    sms_req = SMSRequest(
-        phone="2123124123",
-        message="Hello World",
-        reply_webhook_url="https://my.site/api/handleSmsReply",
-        webhook_data="custom webhook data",
-        sender="test_sender@textbelt.com",
+    responses.add_callback(
+        responses.POST, "https://textbelt.com/text", callback=sms_response_callback
     )
 
-    sms_res = textbelt_client.send_sms(sms_req)
+    sms_res = textbelt_client.send_sms(TEST_SMS_WEBHOOK_REQUEST)
 
+    assert last_request_params() == {
+        "phone": "2123124123",
+        "message": "Hello World",
+        "sender": "test_sender@textbelt.com",
+        "replyWebhookUrl": "https://my.site/api/handleSmsReply",
+        "webhookData": "custom webhook data",
+        "key": "test_api_key",
+    }
     assert sms_res is not None and isinstance(sms_res, SMSResponse), (
         "Expected an SMS response to be returned"
     )
@@ -134,16 +170,9 @@ def test_send_sms_with_reply_webhook__raises_textbelt_exception(
     textbelt_client: TextbeltClient,
 ) -> None:
     responses.post("https://textbelt.com/text", body=HTTPError("Test HTTP Error"))
-    sms_req = SMSRequest(
-        phone="2123124123",
-        message="Hello World",
-        reply_webhook_url="https://my.site/api/handleSmsReply",
-        webhook_data="custom webhook data",
-        sender="test_sender@textbelt.com",
-    )
 
     with pytest.raises(TextbeltException) as ex_info:
-        textbelt_client.send_sms(sms_req)
+        textbelt_client.send_sms(TEST_SMS_WEBHOOK_REQUEST)
 
     assert (
         ex_info.value.message
@@ -153,74 +182,214 @@ def test_send_sms_with_reply_webhook__raises_textbelt_exception(
     assert ex_info.value.ex_type is HTTPError
 
 
+@responses.activate
+def test_send_sms_batch(textbelt_client: TextbeltClient) -> None:
+    def sms_callback(request: PreparedRequest) -> tuple[int, dict[str, str], str]:
+        phone = parse_qs(str(request.body))["phone"][0]
+        return 200, {}, json.dumps({"success": True, "quotaRemaining": 40, "textId": phone})
+
+    responses.add_callback(responses.POST, "https://textbelt.com/text", callback=sms_callback)
+
+    phones = [f"212312412{i}" for i in range(5)]
+    sms_reqs = [SMSRequest(phone=phone, message="Hello World") for phone in phones]
+
+    sms_res = textbelt_client.send_sms_batch(sms_reqs, max_workers=3)
+
+    assert len(responses.calls) == len(phones)
+    assert all(isinstance(res, SMSResponse) for res in sms_res)
+    assert [res.text_id for res in sms_res if isinstance(res, SMSResponse)] == phones, (
+        "Expected responses in the same order as requests"
+    )
+
+
+@responses.activate
+def test_send_sms_batch__returns_textbelt_exception_for_failed_requests(
+    textbelt_client: TextbeltClient,
+) -> None:
+    failing_phone = "2123124122"
+
+    def sms_callback(request: PreparedRequest) -> tuple[int, dict[str, str], str]:
+        phone = parse_qs(str(request.body))["phone"][0]
+        if phone == failing_phone:
+            return 500, {}, ""
+
+        return 200, {}, json.dumps({"success": True, "quotaRemaining": 40, "textId": phone})
+
+    responses.add_callback(responses.POST, "https://textbelt.com/text", callback=sms_callback)
+
+    phones = [f"212312412{i}" for i in range(5)]
+    sms_reqs = [SMSRequest(phone=phone, message="Hello World") for phone in phones]
+
+    sms_res = textbelt_client.send_sms_batch(sms_reqs, max_workers=1)
+
+    sent_phones = sorted(parse_qs(str(call.request.body))["phone"][0] for call in responses.calls)
+    assert sent_phones == phones, "Expected every request to be sent despite the failure"
+
+    failed_res = sms_res[2]
+    assert isinstance(failed_res, TextbeltException)
+    assert failed_res.ex_type is HTTPError
+    assert failed_res.message.startswith("Requests error occurred")
+
+    assert [res.text_id for res in sms_res if isinstance(res, SMSResponse)] == [
+        phone for phone in phones if phone != failing_phone
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_send_sms_batch__invalid_max_workers_raises_textbelt_exception(
+    textbelt_client: TextbeltClient, max_workers: int
+) -> None:
+    with pytest.raises(TextbeltException) as ex_info:
+        textbelt_client.send_sms_batch([TEST_SMS_REQUEST], max_workers=max_workers)
+
+    assert ex_info.value.message == "max_workers must be greater than 0"
+    assert ex_info.value.exception is None
+
+
 def test_verify_webhook__invalid_timestamp(textbelt_client: TextbeltClient) -> None:
     current_time = int(time.time())
     invalid_timestamp = current_time - datetime.timedelta(minutes=100).seconds
-    payload = json.dumps(
-        {
-            "textId": "123456",
-            "fromNumber": "+1555123456",
-            "text": "Here is my reply",
-            "data": "my custom data",
-        },
-    )
-    signature = hmac.new(
-        b"test_api_key",
-        (str(current_time) + payload).encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        str(current_time).encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
 
     is_valid, webhook_payload = textbelt_client.verify_webhook(
         str(invalid_timestamp),
         signature,
-        payload,
+        WEBHOOK_PAYLOAD,
     )
 
     assert is_valid is False, "Expected result to be False since timestamp is invalid"
     assert webhook_payload is None
 
 
+@pytest.mark.parametrize(
+    ("age_seconds", "expected_is_valid"), [(15 * 60, True), (15 * 60 + 1, False)]
+)
+def test_verify_webhook__max_age(
+    textbelt_client: TextbeltClient,
+    monkeypatch: pytest.MonkeyPatch,
+    age_seconds: int,
+    expected_is_valid: bool,
+) -> None:
+    current_time = 1_700_000_000
+    monkeypatch.setattr(time, "time", lambda: float(current_time))
+    timestamp = current_time - age_seconds
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        str(timestamp).encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
+
+    is_valid, _ = textbelt_client.verify_webhook(str(timestamp), signature, WEBHOOK_PAYLOAD)
+
+    assert is_valid is expected_is_valid, "Expected webhooks older than 15 minutes to be invalid"
+
+
+def test_verify_webhook__malformed_timestamp(textbelt_client: TextbeltClient) -> None:
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        b"not-a-timestamp" + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
+
+    is_valid, webhook_payload = textbelt_client.verify_webhook(
+        "not-a-timestamp",
+        signature,
+        WEBHOOK_PAYLOAD,
+    )
+
+    assert is_valid is False, "Expected result to be False since timestamp is not an integer"
+    assert webhook_payload is None
+
+
 def test_verify_webhook__invalid_signature(textbelt_client: TextbeltClient) -> None:
     current_time = int(time.time())
     timestamp = current_time - datetime.timedelta(minutes=5).seconds
-    payload = json.dumps(
-        {
-            "textId": "123456",
-            "fromNumber": "+1555123456",
-            "text": "Here is my reply",
-            "data": "my custom data",
-        },
-    )
-    signature = hmac.new(
-        b"test_api_key",
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
         (str(current_time) + json.dumps({"textId": "invalid"})).encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+        "sha256",
+    ).hex()
 
-    is_valid, webhook_payload = textbelt_client.verify_webhook(str(timestamp), signature, payload)
+    is_valid, webhook_payload = textbelt_client.verify_webhook(
+        str(timestamp), signature, WEBHOOK_PAYLOAD
+    )
 
     assert is_valid is False, "Expected result to be False since signatures do not match"
     assert webhook_payload is None
 
 
+def test_verify_webhook__malformed_signature(textbelt_client: TextbeltClient) -> None:
+    current_time = int(time.time())
+    timestamp = current_time - datetime.timedelta(minutes=5).seconds
+
+    is_valid, webhook_payload = textbelt_client.verify_webhook(
+        str(timestamp),
+        "z" * 64,
+        WEBHOOK_PAYLOAD,
+    )
+
+    assert is_valid is False, "Expected result to be False since signature is not valid hex"
+    assert webhook_payload is None
+
+
+def test_verify_webhook__invalid_signature_length(textbelt_client: TextbeltClient) -> None:
+    current_time = int(time.time())
+    timestamp = current_time - datetime.timedelta(minutes=5).seconds
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        str(timestamp).encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
+
+    is_valid, webhook_payload = textbelt_client.verify_webhook(
+        str(timestamp),
+        signature[:32],
+        WEBHOOK_PAYLOAD,
+    )
+
+    assert is_valid is False, "Expected result to be False since signature is truncated"
+    assert webhook_payload is None
+
+
 def test_verify_webhook(textbelt_client: TextbeltClient) -> None:
     current_time = int(time.time())
     timestamp = current_time - datetime.timedelta(minutes=5).seconds
-    payload = json.dumps(
-        {
-            "textId": "123456",
-            "fromNumber": "+1555123456",
-            "text": "Here is my reply",
-            "data": "my custom data",
-        },
-    )
-    signature = hmac.new(
-        b"test_api_key",
-        (str(timestamp) + payload).encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        str(timestamp).encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
+
+    is_valid, webhook_payload = textbelt_client.verify_webhook(
+        str(timestamp), signature, WEBHOOK_PAYLOAD
+    )
+
+    assert is_valid is True
+    assert webhook_payload is not None
+    assert webhook_payload.text_id == "123456"
+    assert webhook_payload.from_number == "+1555123456"
+    assert webhook_payload.text == "Here is my reply"
+    assert webhook_payload.data == "my custom data"
+
+
+def test_verify_webhook__bytes(textbelt_client: TextbeltClient) -> None:
+    current_time = int(time.time())
+    timestamp = current_time - datetime.timedelta(minutes=5).seconds
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        str(timestamp).encode("utf-8") + WEBHOOK_PAYLOAD_BYTES,
+        "sha256",
+    ).hex()
 
-    is_valid, webhook_payload = textbelt_client.verify_webhook(str(timestamp), signature, payload)
+    is_valid, webhook_payload = textbelt_client.verify_webhook(
+        str(timestamp).encode("utf-8"),
+        signature.encode("utf-8"),
+        WEBHOOK_PAYLOAD_BYTES,
+    )
 
     assert is_valid is True
     assert webhook_payload is not None
@@ -234,11 +403,11 @@ def test_verify_webhook__raises_textbelt_exception(textbelt_client: TextbeltClie
     current_time = int(time.time())
     timestamp = current_time - datetime.timedelta(minutes=5).seconds
     payload = json.dumps({})
-    signature = hmac.new(
-        b"test_api_key",
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
         (str(timestamp) + payload).encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+        "sha256",
+    ).hex()
 
     with pytest.raises(TextbeltException) as ex_info:
         textbelt_client.verify_webhook(str(timestamp), signature, payload)
@@ -251,23 +420,44 @@ def test_verify_webhook__raises_textbelt_exception(textbelt_client: TextbeltClie
     assert ex_info.value.ex_type is ValidationError
 
 
-status_test_cases = [s.value for s in Status]
+def test_verify_webhook__invalid_json_raises_textbelt_exception(
+    textbelt_client: TextbeltClient,
+) -> None:
+    current_time = int(time.time())
+    timestamp = current_time - datetime.timedelta(minutes=5).seconds
+    payload = "not json"
+    signature = hmac.digest(
+        TEST_API_KEY_BYTES,
+        (str(timestamp) + payload).encode("utf-8"),
+        "sha256",
+    ).hex()
+
+    with pytest.raises(TextbeltException) as ex_info:
+        textbelt_client.verify_webhook(str(timestamp), signature, payload)
+
+    assert ex_info.value.message.startswith("Unexpected error occurred")
+    assert isinstance(ex_info.value.exception, json.JSONDecodeError)
+
+
+status_test_cases = list(get_args(SMSStatus))
+status_response_bodies = {
+    status: json.dumps({"status": status}).encode("utf-8") for status in status_test_cases
+}
 
 
 @pytest.mark.parametrize("expected_status", status_test_cases)
 @responses.activate
 def test_check_sms_delivery_status(
     textbelt_client: TextbeltClient,
-    expected_status: Status,
+    expected_status: SMSStatus,
 ) -> None:
     text_id = "589290745829430284"
 
-    resp = responses.Response(
-        method="GET",
-        url=f"https://textbelt.com/status/{text_id}",
-        json={"status": expected_status},
+    responses.add_callback(
+        responses.GET,
+        f"https://textbelt.com/status/{text_id}",
+        callback=lambda request: (200, {}, status_response_bodies[expected_status]),
     )
-    responses.add(resp)
 
     sms_status_response = textbelt_client.check_sms_delivery_status(text_id)
 
@@ -277,6 +467,10 @@ def test_check_sms_delivery_status(
     assert sms_status_response.status == expected_status
 
 
+def test_status_enum_matches_sms_status() -> None:
+    assert [s.value for s in Status] == status_test_cases
+
+
 @responses.activate
 def test_check_sms_delivery_status__raises_textbelt_exception(
     textbelt_client: TextbeltClient,
@@ -303,26 +497,17 @@ def test_check_sms_delivery_status__raises_textbelt_exception(
 
 @responses.activate
 def test_send_otp(textbelt_client: TextbeltClient) -> None:
-    exp_resp = responses.Response(
-        method="POST",
-        url="https://textbelt.com/otp/generate",
-        json={"success": "true", "textId": "1234", "quotaRemaining": 70, "otp": "672383"},
-        match=[
-            responses.matchers.urlencoded_params_matcher(
-                {
-                    "phone": "+15557727420",
-                    "userid": "test_userid_12345",
-                    "key": "test_api_key",
-                },
-            ),
-        ],
+    responses.add_callback(
+        responses.POST, "https://textbelt.com/otp/generate", callback=otp_generate_response_callback
     )
-    responses.add(exp_resp)
-
-    otp_generate_req = OTPGenerateRequest(phone="+15557727420", user_id="test_userid_12345")
 
-    otp_generate_res = textbelt_client.send_otp(otp_generate_req)
+    otp_generate_res = textbelt_client.send_otp(TEST_OTP_GENERATE_REQUEST)
 
+    assert last_request_params() == {
+        "phone": "+15557727420",
+        "userid": "test_userid_12345",
+        "key": "test_api_key",
+    }
     assert otp_generate_res is not None and isinstance(otp_generate_res, OTPGenerateResponse), (
         "Expected an OTP generate response to be returned"
     )
@@ -334,27 +519,20 @@ def test_send_otp(textbelt_client: TextbeltClient) -> None:
 
 @responses.activate
 def test_send_otp__raises_textbelt_exception(textbelt_client: TextbeltClient) -> None:
-    exp_resp = responses.Response(
-        method="POST",
-        url="https://textbelt.com/otp/generate",
-        json={"success": "invalid"},
-        match=[
-            responses.matchers.urlencoded_params_matcher(
-                {
-                    "phone": "+15557727420",
-                    "userid": "test_userid_12345",
-                    "key": "test_api_key",
-                },
-            ),
-        ],
+    responses.add_callback(
+        responses.POST,
+        "https://textbelt.com/otp/generate",
+        callback=invalid_otp_generate_response_callback,
     )
-    responses.add(exp_resp)
-
-    otp_generate_req = OTPGenerateRequest(phone="+15557727420", user_id="test_userid_12345")
 
     with pytest.raises(TextbeltException) as ex_info:
-        textbelt_client.send_otp(otp_generate_req)
+        textbelt_client.send_otp(TEST_OTP_GENERATE_REQUEST)
 
+    assert last_request_params() == {
+        "phone": "+15557727420",
+        "userid": "test_userid_12345",
+        "key": "test_api_key",
+    }
     assert (
         "Pydantic error occurred (Type = <class 'pydantic_core._pydantic_core.ValidationError'> | Message = 3 validation errors for OTPGenerateResponse"
         in ex_info.value.message
@@ -381,9 +559,7 @@ def test_verify_otp(textbelt_client: TextbeltClient) -> None:
     )
     responses.add(exp_resp)
 
-    otp_verification_req = OTPVerificationRequest(otp="321654", user_id="test_userid_12345")
-
-    otp_verification_res = textbelt_client.verify_otp(otp_verification_req)
+    otp_verification_res = textbelt_client.verify_otp(TEST_OTP_VERIFICATION_REQUEST)
 
     assert otp_verification_res is not None and isinstance(
         otp_verification_res,
@@ -411,10 +587,8 @@ def test_verify_otp__raises_textbelt_exception(textbelt_client: TextbeltClient)
     )
     responses.add(exp_resp)
 
-    otp_verification_req = OTPVerificationRequest(otp="321654", user_id="test_userid_12345")
-
     with pytest.raises(TextbeltException) as ex_info:
-        textbelt_client.verify_otp(otp_verification_req)
+        textbelt_client.verify_otp(TEST_OTP_VERIFICATION_REQUEST)
 
     assert (
         "Unexpected error occurred (Type = <class 'Exception'> | Message = Test Exception)"
@@ -460,3 +634,41 @@ def test_check_credit_balance__raises_textbelt_exception(textbelt_client: Textbe
     )
     assert isinstance(ex_info.value.exception, Exception)
     assert ex_info.value.ex_type is Exception
+
+
+@responses.activate
+def test_check_credit_balance__latin1_body(textbelt_client: TextbeltClient) -> None:
+    resp = responses.Response(
+        method="GET",
+        url=f"https://textbelt.com/quota/{TEST_API_KEY}",
+        body='{"success": true, "quotaRemaining": 100, "note": "café"}'.encode("latin-1"),
+        content_type="application/json; charset=latin-1",
+    )
+    responses.add(resp)
+
+    credit_balance_response = textbelt_client.check_credit_balance()
+
+    assert credit_balance_response.success is True
+    assert credit_balance_response.quota_remaining == 100
+
+
+@responses.activate
+def test_check_credit_balance__invalid_json_raises_textbelt_exception(
+    textbelt_client: TextbeltClient,
+) -> None:
+    resp = responses.Response(
+        method="GET",
+        url=f"https://textbelt.com/quota/{TEST_API_KEY}",
+        body="not json",
+    )
+    responses.add(resp)
+
+    with pytest.raises(TextbeltException) as ex_info:
+        textbelt_client.check_credit_balance()
+
+    assert (
+        ex_info.value.message
+        == "Requests error occurred (Type = <class 'requests.exceptions.JSONDecodeError'> | Message = Expecting value: line 1 column 1 (char 0))"
+    )
+    assert isinstance(ex_info.value.exception, JSONDecodeError)
+    assert ex_info.value.ex_type is JSONDecodeError
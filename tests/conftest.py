@@ -0,0 +1,31 @@
+import pytest
+
+from textbelt_py import TextbeltClient
+
+from .constants import TEST_API_KEY
+
+
+# session scoped fixtures are created once per `pytest-xdist` worker process,
+# so each worker gets its own client and session.
+@pytest.fixture(scope="session")
+def textbelt_client() -> TextbeltClient:
+    return TextbeltClient(TEST_API_KEY, None)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run integration tests that make live calls to the Textbelt API",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="needs --run-integration option to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
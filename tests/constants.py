@@ -0,0 +1,14 @@
+import json
+
+TEST_API_KEY = "test_api_key"
+TEST_API_KEY_BYTES = TEST_API_KEY.encode("utf-8")
+
+WEBHOOK_PAYLOAD = json.dumps(
+    {
+        "textId": "123456",
+        "fromNumber": "+1555123456",
+        "text": "Here is my reply",
+        "data": "my custom data",
+    },
+)
+WEBHOOK_PAYLOAD_BYTES = WEBHOOK_PAYLOAD.encode("utf-8")
@@ -1,86 +1,115 @@
+from json import JSONDecodeError as StdJSONDecodeError
+
 import pytest
 from pydantic import ValidationError
 from requests import Response
 from requests.exceptions import HTTPError, JSONDecodeError
 
-from textbelt_py.decorators import exception_handler_decorator
+from textbelt_py._json import loads
+from textbelt_py.decorators import exception_handler_decorator, wrap_exception
 from textbelt_py.exceptions import TextbeltException
 from textbelt_py.models import SMSStatusResponse
 
 
-def test_exception_handler_decorator_handles_textbelt_exception() -> None:
-    @exception_handler_decorator
-    def textbelt_exception_func() -> None:
-        raise TextbeltException("Test Exception")
+def test_wrap_exception_handles_textbelt_exception() -> None:
+    textbelt_exception = wrap_exception(TextbeltException("Test Exception"))
 
-    with pytest.raises(TextbeltException) as ex_info:
-        textbelt_exception_func()
+    assert textbelt_exception.message == "Test Exception"
+    assert textbelt_exception.exception is None
+    assert textbelt_exception.ex_type is None
 
-    assert ex_info.value.message == "Test Exception"
-    assert ex_info.value.exception is None
-    assert ex_info.value.ex_type is None
 
+def test_wrap_exception_propagates_same_textbelt_exception() -> None:
+    textbelt_exception = TextbeltException("Test Exception", exception=ValueError("Test Error"))
 
-def test_exception_handler_decorator_handles_requests_http_error() -> None:
-    @exception_handler_decorator
-    def textbelt_exception_func() -> None:
-        raise HTTPError("Test Exception")
+    wrapped_exception = wrap_exception(textbelt_exception)
 
-    with pytest.raises(TextbeltException) as ex_info:
-        textbelt_exception_func()
+    assert wrapped_exception is textbelt_exception
+    assert wrapped_exception.ex_type is ValueError
+    assert (
+        str(wrapped_exception)
+        == "Test Exception (Type = <class 'ValueError'> | Message = Test Error)"
+    )
+
+
+def test_wrap_exception_handles_requests_http_error() -> None:
+    textbelt_exception = wrap_exception(HTTPError("Test Exception"))
 
     assert (
-        ex_info.value.message
+        textbelt_exception.message
         == "Requests error occurred (Type = <class 'requests.exceptions.HTTPError'> | Message = Test Exception)"
     )
-    assert isinstance(ex_info.value.exception, HTTPError)
-    assert ex_info.value.ex_type is HTTPError
+    assert isinstance(textbelt_exception.exception, HTTPError)
+    assert textbelt_exception.ex_type is HTTPError
 
 
-def test_exception_handler_decorator_handles_requests_json_decode_error() -> None:
-    @exception_handler_decorator
-    def textbelt_exception_func() -> None:
-        response = Response()
-        response.json()
+def test_wrap_exception_handles_requests_json_decode_error() -> None:
+    with pytest.raises(JSONDecodeError) as ex_info:
+        Response().json()
 
-    with pytest.raises(TextbeltException) as ex_info:
-        textbelt_exception_func()
+    textbelt_exception = wrap_exception(ex_info.value)
 
     assert (
-        ex_info.value.message
+        textbelt_exception.message
         == "Requests error occurred (Type = <class 'requests.exceptions.JSONDecodeError'> | Message = Expecting value: line 1 column 1 (char 0))"
     )
-    assert isinstance(ex_info.value.exception, JSONDecodeError)
-    assert ex_info.value.ex_type is JSONDecodeError
+    assert isinstance(textbelt_exception.exception, JSONDecodeError)
+    assert textbelt_exception.ex_type is JSONDecodeError
 
 
-def test_exception_handler_decorator_handles_pydantic_validation_error() -> None:
-    @exception_handler_decorator
-    def textbelt_exception_func() -> None:
+def test_wrap_exception_handles_json_decode_error() -> None:
+    with pytest.raises(StdJSONDecodeError) as ex_info:
+        loads(b"")
+
+    textbelt_exception = wrap_exception(ex_info.value)
+
+    assert textbelt_exception.message.startswith("Unexpected error occurred")
+    assert isinstance(textbelt_exception.exception, StdJSONDecodeError)
+
+
+def test_wrap_exception_handles_pydantic_validation_error() -> None:
+    with pytest.raises(ValidationError) as ex_info:
         SMSStatusResponse.model_validate(None)
 
-    with pytest.raises(TextbeltException) as ex_info:
-        textbelt_exception_func()
+    textbelt_exception = wrap_exception(ex_info.value)
 
     assert (
         "Pydantic error occurred (Type = <class 'pydantic_core._pydantic_core.ValidationError'> | Message = 1 validation error for SMSStatusResponse"
-        in ex_info.value.message
+        in textbelt_exception.message
     )
-    assert isinstance(ex_info.value.exception, ValidationError)
-    assert ex_info.value.ex_type is ValidationError
+    assert isinstance(textbelt_exception.exception, ValidationError)
+    assert textbelt_exception.ex_type is ValidationError
+
 
+def test_wrap_exception_handles_unexpected_exception() -> None:
+    textbelt_exception = wrap_exception(Exception("Text Exception"))
 
-def test_exception_handler_decorator_handles_unexcpted_exception() -> None:
+    assert (
+        textbelt_exception.message
+        == "Unexpected error occurred (Type = <class 'Exception'> | Message = Text Exception)"
+    )
+    assert isinstance(textbelt_exception.exception, Exception)
+    assert textbelt_exception.ex_type is Exception
+
+
+def test_exception_handler_decorator_returns_result() -> None:
+    @exception_handler_decorator
+    def textbelt_func(value: int) -> int:
+        return value + 1
+
+    assert textbelt_func(1) == 2
+
+
+def test_exception_handler_decorator_wraps_exception() -> None:
     @exception_handler_decorator
     def textbelt_exception_func() -> None:
-        raise Exception("Text Exception")
+        raise HTTPError("Test Exception")
 
     with pytest.raises(TextbeltException) as ex_info:
         textbelt_exception_func()
 
     assert (
         ex_info.value.message
-        == "Unexpected error occurred (Type = <class 'Exception'> | Message = Text Exception)"
+        == "Requests error occurred (Type = <class 'requests.exceptions.HTTPError'> | Message = Test Exception)"
     )
-    assert isinstance(ex_info.value.exception, Exception)
-    assert ex_info.value.ex_type is Exception
+    assert ex_info.value.ex_type is HTTPError
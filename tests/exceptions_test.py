@@ -0,0 +1,58 @@
+import copy
+import pickle
+
+from textbelt_py.exceptions import TextbeltException
+
+
+def test_textbelt_exception_pickle_round_trip() -> None:
+    textbelt_exception = TextbeltException("Pydantic error occurred", exception=ValueError("boom"))
+    textbelt_exception.add_note("Test Note")
+    setattr(textbelt_exception, "request_id", "12345")
+
+    for restored in (
+        pickle.loads(pickle.dumps(textbelt_exception)),
+        copy.copy(textbelt_exception),
+        copy.deepcopy(textbelt_exception),
+    ):
+        assert isinstance(restored, TextbeltException)
+        assert isinstance(restored.exception, ValueError)
+        assert str(restored.exception) == "boom"
+        assert restored.ex_type is ValueError
+        assert (
+            str(restored)
+            == "Pydantic error occurred (Type = <class 'ValueError'> | Message = boom)"
+        )
+        assert restored.__notes__ == ["Test Note"]
+        assert getattr(restored, "request_id") == "12345"
+
+
+def test_textbelt_exception_message_is_formatted_once() -> None:
+    textbelt_exception = TextbeltException("Test Exception", exception=ValueError("Test Error"))
+
+    assert textbelt_exception.message is textbelt_exception.message
+    assert (
+        textbelt_exception.message
+        == "Test Exception (Type = <class 'ValueError'> | Message = Test Error)"
+    )
+
+
+def test_textbelt_exception_set_message() -> None:
+    textbelt_exception = TextbeltException("Test Exception", exception=ValueError("Test Error"))
+    assert textbelt_exception.message.startswith("Test Exception")
+
+    textbelt_exception.message = "New Test Exception"
+
+    assert textbelt_exception.message == "New Test Exception"
+    assert str(textbelt_exception) == "New Test Exception"
+    assert str(pickle.loads(pickle.dumps(textbelt_exception))) == "New Test Exception"
+
+
+def test_textbelt_exception_append_to_message() -> None:
+    textbelt_exception = TextbeltException("Test Exception", exception=ValueError("Test Error"))
+
+    textbelt_exception.message += " [retrying]"
+
+    assert (
+        textbelt_exception.message
+        == "Test Exception (Type = <class 'ValueError'> | Message = Test Error) [retrying]"
+    )
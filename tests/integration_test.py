@@ -3,7 +3,8 @@ import os
 import pytest
 
 from textbelt_py import OTPGenerateRequest, OTPVerificationRequest, SMSRequest, TextbeltClient
-from textbelt_py.models import Status
+
+pytestmark = pytest.mark.integration
 
 
 @pytest.fixture
@@ -44,7 +45,7 @@ def test_check_sms_delivery_status(textbelt_client: TextbeltClient) -> None:
     resp = textbelt_client.check_sms_delivery_status(test_text_id)
 
     assert resp is not None
-    assert resp.status == Status.UNKNOWN
+    assert resp.status == "UNKNOWN"
 
 
 def test_send_otp(textbelt_client: TextbeltClient) -> None: